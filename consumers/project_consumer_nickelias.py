@@ -18,16 +18,36 @@ Example JSON message (after deserialization) to be analyzed
 #####################################
 
 # Import packages from Python Standard Library
+import math  # stepped axis limits
 import os
-import json  # handle JSON parsing
-from collections import defaultdict, deque  # data structure for counting author occurrences (defaultdict) and handling message lengths (deque)
-from datetime import datetime  # handle timestamps  
+import sys  # sys.intern for repeated author and category strings
+from collections import Counter  # data structure for counting author occurrences
+from concurrent.futures import ThreadPoolExecutor  # parse large batches on worker threads
+from heapq import nlargest  # select the top-K counts without sorting everything
+from operator import itemgetter
+from datetime import datetime, timezone  # handle timestamps
 import matplotlib.dates as mdates
 
 # Import external packages
 from dotenv import load_dotenv
+import numpy as np  # fixed-size ring buffers and vectorized histograms
+import orjson  # fast JSON parsing (accepts bytes directly)
 import threading
 
+# Import simdjson only if available; otherwise fall back to orjson
+try:
+    import simdjson  # SIMD JSON parsing with lazy field access
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Import ciso8601 only if available; otherwise fall back to datetime.fromisoformat
+try:
+    import ciso8601  # C extension for fast ISO 8601 timestamp parsing
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 # IMPORTANT
 # Import Matplotlib.pyplot for live plotting
 # Use the common alias 'plt' for Matplotlib.pyplot
@@ -39,6 +59,10 @@ from matplotlib.animation import FuncAnimation
 from utils.utils_consumer import create_kafka_consumer
 from utils.utils_logger import logger
 
+# Lazy logger for per-batch debug output: arguments are callables that are
+# only evaluated (and formatted) if a sink actually handles the log level
+lazy_logger = logger.opt(lazy=True)
+
 #####################################
 # Load Environment Variables
 #####################################
@@ -64,17 +88,125 @@ def get_kafka_consumer_group_id() -> str:
     return group_id
 
 
+def get_parser_workers() -> int:
+    """
+    Fetch the number of JSON parser threads from environment or use default.
+
+    The default of 1 parses inline on the consumer thread. orjson and simdjson
+    hold the GIL while parsing, so more workers only help on free-threaded
+    Python builds; on a standard build they add overhead.
+    """
+    workers = int(os.getenv("PROJECT_PARSER_WORKERS", 1))
+    logger.info(f"JSON parser workers: {workers}")
+    return workers
+
+
+#####################################
+# Kafka polling settings
+#####################################
+
+POLL_TIMEOUT_MS = 500  # wait up to this long for a batch of records (keep >= 100 ms)
+POLL_MAX_RECORDS = 500  # process at most this many records per poll
+FETCH_MIN_BYTES = 1 << 16  # ask the broker to gather 64 KiB before answering
+FETCH_MAX_WAIT_MS = 100  # but never wait longer than this
+MAX_PARTITION_FETCH_BYTES = 5 << 20  # allow up to 5 MiB per partition per fetch
+
+# The paired producer (producers/project_producer_case.py) batches and
+# compresses on its side with linger_ms=100, batch_size=64000 and
+# compression_type="lz4", so each fetch carries many messages.
+
+#####################################
+# Set up JSON parsing
+#####################################
+
+# Each thread reuses its own simdjson parser, so the internal buffers are
+# allocated once per thread (a simdjson parser must not be shared between threads)
+_parser_local = threading.local()
+JSON_OBJECT_TYPES = (simdjson.Object,) if SIMDJSON_AVAILABLE else (dict,)
+
+# Batches larger than this are split into slices of this size for the parser threads
+PARSE_SLICE_SIZE = 128
+
+
+def parse_json(message: bytes):
+    """
+    Parse raw JSON bytes.
+
+    With simdjson the returned object is a lazy view; only the fields read
+    from it are converted to Python objects. Without simdjson, orjson builds a dict.
+    Both raise ValueError on invalid JSON.
+    """
+    if SIMDJSON_AVAILABLE:
+        parser = getattr(_parser_local, "parser", None)
+        if parser is None:
+            parser = _parser_local.parser = simdjson.Parser()
+        return parser.parse(message)
+    return orjson.loads(message)
+
+
+#####################################
+# Set up timestamp parsing
+#####################################
+
+SECONDS_PER_DAY = 86400.0
+
+# Pin Matplotlib's date epoch to the Unix epoch, so a Matplotlib date number is
+# simply epoch seconds / SECONDS_PER_DAY (must run before any date is converted)
+mdates.set_epoch("1970-01-01T00:00:00")
+
+
+def parse_timestamp(timestamp_str: str) -> float:
+    """
+    Parse an ISO 8601 timestamp into epoch seconds.
+
+    Naive timestamps are treated as UTC, matching how Matplotlib plots naive datetimes.
+    Raises ValueError on an invalid timestamp.
+    """
+    if CISO8601_AVAILABLE:
+        timestamp = ciso8601.parse_datetime(timestamp_str)
+    else:
+        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
 #####################################
 # Set up data structures
 #####################################
 
 # Initialize a dictionary to store author counts
-author_counts = defaultdict(int)
+# The totals are only touched by the plot thread
+author_counts = Counter()
 
 # Data structures for new dashboard metrics
-category_counts = defaultdict(int)
-sentiment_trend = deque(maxlen=20)  # deque for storing the last 5 sentiment scores
-message_lengths = []  # list of message lengths
+category_counts = Counter()
+
+# Counts received since the last frame, only touched by the consumer thread
+live_author_counts = Counter()
+live_category_counts = Counter()
+
+# Guards the live counters and ring buffers; once per frame the plot thread
+# swaps out the counters and copies the ring buffers under it
+metrics_lock = threading.Lock()
+
+# Total messages applied, used to rate-limit the metrics log
+METRICS_LOG_INTERVAL = 1000
+_messages_processed = 0
+
+# Parallel ring buffers of (Matplotlib date number, sentiment) for the last 20 messages
+SENTIMENT_WINDOW = 20
+sentiment_times = np.empty(SENTIMENT_WINDOW, dtype=np.float64)
+sentiment_scores = np.empty(SENTIMENT_WINDOW, dtype=np.float64)
+_sent_idx = 0  # next write position in the sentiment buffers
+_sent_count = 0  # number of valid entries in the sentiment buffers
+
+# Fixed-size ring buffer of the most recent message lengths (constant memory)
+MESSAGE_LENGTH_BUFFER_SIZE = 10000
+message_lengths = np.empty(MESSAGE_LENGTH_BUFFER_SIZE, dtype=np.int32)
+_ml_idx = 0  # next write position in message_lengths
+_ml_full = False  # True once the buffer has wrapped around
+MESSAGE_LENGTH_LIMIT = np.iinfo(np.int32).max  # larger lengths are rejected per message
 
 # Use the subplots() method to create a tuple containing
 # two objects at once:
@@ -82,145 +214,488 @@ message_lengths = []  # list of message lengths
 # - an axis (what they call a chart in Matplotlib)
 fig, axs = plt.subplots(2, 2, figsize=(12, 8))
 
-# Use the ion() method (stands for "interactive on")
-# to turn on interactive mode for live updates
-plt.ion()
+# Static chart decorations are set once; each frame only updates data artists
+axs[0, 0].set_xlabel("Authors")
+axs[0, 0].set_ylabel("Message Counts")
+axs[0, 0].set_title("Author Message Counts")
+axs[0, 0].tick_params(axis="x", labelrotation=45)
+
+axs[0, 1].set_title("Message Categories")
+axs[0, 1].set_aspect("equal")
+axs[0, 1].axis("off")
+
+axs[1, 0].set_xlabel("Timestamp")
+axs[1, 0].set_ylabel("Sentiment")
+axs[1, 0].set_title("Sentiment Trend Over Time")
+axs[1, 0].xaxis.set_major_locator(mdates.AutoDateLocator())
+axs[1, 0].xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+axs[1, 0].tick_params(axis="x", labelrotation=45)
+
+axs[1, 1].set_xlabel("Message Length")
+axs[1, 1].set_ylabel("Frequency")
+axs[1, 1].set_title("Message Length Distribution")
+
+fig.tight_layout()
+
+#####################################
+# Set up persistent chart artists
+# These are created once and updated in place, so FuncAnimation
+# can blit only the changed artists onto a cached background
+#####################################
+
+# Only the largest counters are drawn, bounding per-frame work and artist count
+TOP_AUTHORS = 15
+TOP_CATEGORIES = 10  # one distinct color per wedge
+
+# Histogram bins have integer width and span the observed length range.
+# They only move when a length falls outside every length seen so far,
+# so in steady state binning is a single vectorized pass and bars only change height
+HISTOGRAM_BINS = 10
+bin_edges = np.arange(HISTOGRAM_BINS + 1)  # placeholder until the first lengths arrive
+_length_range = None  # (min, max) message length seen so far
+
+# Author bars are cached and rebuilt only when the set of top authors changes
+_bar_state = {"authors": None, "rects": None}
+category_artists = []  # pie wedges and labels
+_categories_dirty = False  # True when new category counts arrived since the last frame
+_last_cat_key = None  # rounded category shares the current pie was drawn with
+(sentiment_line,) = axs[1, 0].plot([], [], marker='o', linestyle='-', color="green", animated=True)
+length_bars = axs[1, 1].bar(
+    bin_edges[:-1],
+    np.zeros(HISTOGRAM_BINS),
+    width=np.diff(bin_edges),
+    align="edge",
+    color="orange",
+    edgecolor="black",
+    animated=True,
+)
 
 #####################################
 # Define an update chart function for live plotting
-# This will get called every time a new message is processed
+# This will get called every time the dashboard animation ticks
 #####################################
 
-def plot_author_counts(ax):
-    # --- Top-Left: Author Counts Bar Chart ---
-    authors_list = list(author_counts.keys())
-    counts_list = list(author_counts.values())
-    axs[0, 0].bar(authors_list, counts_list, color="skyblue")
-    axs[0, 0].set_xlabel("Authors")
-    axs[0, 0].set_ylabel("Message Counts")
-    axs[0, 0].set_title("Author Message Counts")
-    axs[0, 0].set_xticklabels(authors_list)
-    fig.autofmt_xdate(bottom=0.2, rotation=45)
+_background_stale = False  # True when ticks changed without a change in axis limits
+_sentiment_ylim = None  # y-limits last chosen for the sentiment trend
+dashboard_animation = None  # set in main, so a relayout can drop its cached backgrounds
+
+
+def set_limits_if_changed(ax, xlim=None, ylim=None) -> None:
+    """Set axis limits only when the new bounds differ from the current ones."""
+    if xlim is not None and xlim[0] < xlim[1] and tuple(ax.get_xlim()) != tuple(xlim):
+        ax.set_xlim(xlim)
+    if ylim is not None and ylim[0] < ylim[1] and tuple(ax.get_ylim()) != tuple(ylim):
+        ax.set_ylim(ylim)
+
+
+def count_headroom(value) -> float:
+    """
+    Return the smallest power of two above value (with a little margin).
+
+    Growing counts then only move the y-limit, and force a full redraw,
+    each time they double instead of on every frame.
+    """
+    return float(2 ** math.ceil(math.log2(max(value, 1) * 1.05)))
+
 
+def time_headroom(ax, mdates_times) -> tuple:
+    """
+    Return x-limits for the sentiment trend that leave room for new points.
 
-def plot_categories(ax):
+    The current limits are kept while every point fits. Once a time falls
+    outside them, the axis is reset to start at the earliest point, with twice
+    as much empty room to the right as the current data spans. Arrival order
+    need not match timestamp order, so the bounds come from min and max.
+    """
+    first, last = float(mdates_times.min()), float(mdates_times.max())
+    left, right = ax.get_xlim()
+    if left <= first and last <= right:
+        return left, right
+    span = max(last - first, 1.0 / SECONDS_PER_DAY)  # at least one second of room
+    return first, last + 2 * span
+
+
+def sentiment_headroom(sentiments) -> tuple:
+    """
+    Return y-limits for the sentiment trend, rounded out to quarters.
+
+    The previous limits are kept while every score still fits inside them.
+    """
+    global _sentiment_ylim
+
+    low, high = float(sentiments.min()), float(sentiments.max())
+    if _sentiment_ylim is None or not (_sentiment_ylim[0] < low and high < _sentiment_ylim[1]):
+        low = math.floor(low * 4) / 4
+        high = max(math.ceil(high * 4) / 4, low + 0.25)
+        _sentiment_ylim = (low - 0.05, high + 0.05)
+    return _sentiment_ylim
+
+
+def collect_live_data() -> tuple:
+    """
+    Swap out the live counters, snapshot the ring buffers and fold the counters into the plotted totals.
+
+    Only the O(1) swap and the small buffer copies happen under the lock, so the
+    consumer thread is never blocked while the much slower merge and drawing happen.
+
+    Returns:
+        tuple: (sentiment date numbers, sentiment scores, message lengths), in chronological order.
+    """
+    global live_author_counts, live_category_counts, _categories_dirty
+
+    with metrics_lock:
+        new_authors, live_author_counts = live_author_counts, Counter()
+        new_categories, live_category_counts = live_category_counts, Counter()
+        # Restore chronological order only once the buffers have wrapped around
+        if _sent_count < SENTIMENT_WINDOW:
+            times = sentiment_times[:_sent_count].copy()
+            sentiments = sentiment_scores[:_sent_count].copy()
+        else:
+            times = np.roll(sentiment_times, -_sent_idx)
+            sentiments = np.roll(sentiment_scores, -_sent_idx)
+        lengths = message_lengths.copy() if _ml_full else message_lengths[:_ml_idx].copy()
+    author_counts.update(new_authors)
+    category_counts.update(new_categories)
+    if new_categories:
+        _categories_dirty = True
+    return times, sentiments, lengths
+
+
+def plot_author_counts(ax) -> list:
+    # --- Top-Left: Author Counts Bar Chart ---
+    global _background_stale
+
+    top = nlargest(TOP_AUTHORS, author_counts.items(), key=itemgetter(1))
+    top.sort()  # Order by name, so the bars only move when the top set changes
+    authors_list = tuple(author for author, _ in top)
+    counts_list = [count for _, count in top]
+
+    if authors_list == _bar_state["authors"]:
+        for rect, count in zip(_bar_state["rects"], counts_list):
+            rect.set_height(count)
+    else:
+        if _bar_state["rects"] is not None:
+            _bar_state["rects"].remove()
+        positions = range(len(authors_list))
+        _bar_state["rects"] = ax.bar(positions, counts_list, color="skyblue", animated=True)
+        _bar_state["authors"] = authors_list
+        ax.set_xticks(positions)
+        ax.set_xticklabels(authors_list)
+        _background_stale = True  # New tick labels must be drawn on the background
+
+    if counts_list:
+        set_limits_if_changed(
+            ax,
+            xlim=(-0.5, len(authors_list) - 0.5),
+            ylim=(0, count_headroom(max(counts_list))),
+        )
+    return list(_bar_state["rects"] or [])
+
+
+def plot_categories(ax) -> list:
     # --- Top-Right: Category Distribution Pie Chart ---
-    categories = list(category_counts.keys())
-    cat_counts = list(category_counts.values())
+    global category_artists, _categories_dirty, _last_cat_key
+
+    # The pie is the most expensive artist to build, so only rebuild it when
+    # some category share moved by at least one percentage point
+    if not _categories_dirty:
+        return category_artists
+    _categories_dirty = False
+
+    top = nlargest(TOP_CATEGORIES, category_counts.items(), key=itemgetter(1))
+    total = sum(category_counts.values())
+    key = tuple((category, round(count / total, 2)) for category, count in top)
+    if key == _last_cat_key:
+        return category_artists
+    _last_cat_key = key
+
+    for artist in category_artists:
+        artist.remove()
+    category_artists = []
+
+    categories, cat_counts = zip(*top) if top else ([], [])
     if categories:  # Only draw if data exists
-        axs[0, 1].pie(cat_counts, labels=categories, autopct="%1.1f%%")
-    axs[0, 1].set_title("Message Categories")
+        # Pin colors so wedges keep their color when rebuilt on a persistent axis
+        colors = [f"C{i % 10}" for i in range(len(categories))]
+        wedges, texts, autotexts = ax.pie(cat_counts, labels=categories, colors=colors, autopct="%1.1f%%")
+        category_artists = [*wedges, *texts, *autotexts]
+        for artist in category_artists:
+            artist.set_animated(True)
+    return category_artists
 
 
-def plot_sentiment_trend(ax):
+def plot_sentiment_trend(ax, mdates_times, sentiments) -> list:
     # --- Bottom-Left: Sentiment Trend Line Chart ---
-    if sentiment_trend:
-        # Unpack the deque into separate lists
-        times = [item[0] for item in sentiment_trend]
-        sentiments = [item[1] for item in sentiment_trend]
-        mdates_times = mdates.date2num(times)  # Convert datetime objects to numbers
-        
-        axs[1, 0].plot(mdates_times, sentiments, marker='o', linestyle='-', color="green")
-        axs[1, 0].set_xlabel("Timestamp")
-        axs[1, 0].set_ylabel("Sentiment")
-        axs[1, 0].set_title("Sentiment Trend Over Time")
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-
-        # Set x-axis limits (optional, but good practice)
-        if times:
-            ax.set_xlim(min(mdates_times), max(mdates_times))  # Set x-axis limits
-
-        fig.autofmt_xdate(bottom=0.2, rotation=45)
-
-
-def plot_message_lengths(ax):
+    if mdates_times.size > 0:
+        # Times are stored as date numbers already, so no conversion per frame
+        sentiment_line.set_data(mdates_times, sentiments)
+        # Pad the time axis and round the sentiment range out to quarters, kept
+        # while the data fits, so the limits and the full redraw they need change rarely
+        set_limits_if_changed(
+            ax,
+            xlim=time_headroom(ax, mdates_times),
+            ylim=sentiment_headroom(sentiments),
+        )
+    return [sentiment_line]
+
+
+def update_bin_edges(ax, valid) -> None:
+    """Widen the histogram bins when a message length falls outside the range seen so far."""
+    global bin_edges, _length_range
+
+    low, high = int(valid.min()), int(valid.max())
+    if _length_range is not None:
+        if _length_range[0] <= low and high <= _length_range[1]:
+            return
+        low, high = min(low, _length_range[0]), max(high, _length_range[1])
+    _length_range = (low, high)
+
+    width = max(1, -(-(high - low + 1) // HISTOGRAM_BINS))  # ceiling division
+    bin_edges = low + width * np.arange(HISTOGRAM_BINS + 1)
+    for rect, left in zip(length_bars, bin_edges[:-1]):
+        rect.set_x(left)
+        rect.set_width(width)
+    set_limits_if_changed(ax, xlim=(float(bin_edges[0]), float(bin_edges[-1])))
+
+
+def plot_message_lengths(ax, valid) -> list:
     # --- Bottom-Right: Message Length Histogram ---
-    if message_lengths:
-        hist_counts, bins, patches = axs[1, 1].hist(message_lengths, bins=10, color="orange", edgecolor="black")  # Get counts
-        axs[1, 1].set_xlabel("Message Length")
-        axs[1, 1].set_ylabel("Frequency")
-        axs[1, 1].set_title("Message Length Distribution")
-        if hist_counts.size > 0: # Check if the histogram has any data before finding the max
-            axs[1, 1].set_ylim(0, max(hist_counts) * 1.1)  # Set dynamic y-axis limit
+    if valid.size > 0:
+        update_bin_edges(ax, valid)
+        hist_counts, _ = np.histogram(valid, bins=bin_edges)
+        for rect, height in zip(length_bars, hist_counts):
+            rect.set_height(height)
+        set_limits_if_changed(ax, ylim=(0, count_headroom(hist_counts.max())))  # Set dynamic y-axis limit
+    return list(length_bars)
+
+
+def update_dashboard(frame) -> list:
+    """
+    Update the dashboard artists and return them for blitting.
 
+    If any axis limits or tick labels changed, the layout is refit to the new
+    tick labels and the static background is redrawn once, so the blitted
+    artists land on an up-to-date background.
+    """
+    global _background_stale
 
-def update_dashboard(frame):
-    for ax in axs.flatten():
-        ax.clear()
+    times, sentiments, lengths = collect_live_data()
+    views_before = [(ax.get_xlim(), ax.get_ylim()) for ax in axs.flat]
 
-    plot_author_counts(axs[0, 0])
-    plot_categories(axs[0, 1])
-    plot_sentiment_trend(axs[1, 0])
-    plot_message_lengths(axs[1, 1])
+    artists = []
+    artists += plot_author_counts(axs[0, 0])
+    artists += plot_categories(axs[0, 1])
+    artists += plot_sentiment_trend(axs[1, 0], times, sentiments)
+    artists += plot_message_lengths(axs[1, 1], lengths)
 
-    fig.tight_layout()  # Move tight_layout here, after all plots are updated
+    views_after = [(ax.get_xlim(), ax.get_ylim()) for ax in axs.flat]
+    if _background_stale or views_after != views_before:
+        # The layout can move the axes, so every cached blit background is dropped
+        # and captured again from the redrawn canvas
+        fig.tight_layout()
+        if dashboard_animation is not None:
+            dashboard_animation._blit_cache.clear()
+        fig.canvas.draw()
+        _background_stale = False
 
-    plt.draw()
+    return artists
 
 
 #####################################
-# Function to process a single message
+# Functions to process messages
 # #####################################
 
-def process_message(message: str) -> None:
+def parse_message(message: bytes):
     """
-    Process a single JSON message from Kafka and update the dashboard data.
+    Parse a single JSON message from Kafka into the fields the dashboard uses.
+
+    The raw message bytes are parsed directly, skipping the str decode step.
+    Only the fields used by the dashboard are pulled out of the parsed document.
+
+    Returns:
+        tuple: (author, category, epoch seconds or NaN, sentiment, message length),
+        or None if the message cannot be used.
     """
     try:
-        logger.debug(f"Raw message: {message}")
-        message_dict: dict = json.loads(message)
-        logger.info(f"Processed JSON message: {message_dict}")
-
-        if isinstance(message_dict, dict):
-            # Update author counts
-            author = message_dict.get("author", "unknown")
-            logger.info(f"Message received from author: {author}")
-            author_counts[author] += 1
-
-            # Update category counts
-            category = message_dict.get("category", "uncategorized")
-            category_counts[category] += 1
-
-            # Update sentiment trend (Corrected and Simplified)
-            timestamp_str = message_dict.get("timestamp", "")
-            sentiment = message_dict.get("sentiment", 0.0)
-
-            if timestamp_str:  # Only proceed if a timestamp exists
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    sentiment_trend.append((timestamp, sentiment))  # Append only ONCE and with datetime
-                except ValueError:
-                    logger.error(f"Invalid timestamp format: {timestamp_str}")
-
-            # Update message lengths
-            message_length = message_dict.get("message_length", 0)
-            message_lengths.append(message_length)
-
-            logger.info(f"Updated metrics - Authors: {dict(author_counts)}, Categories: {dict(category_counts)}")
-        else:
-            logger.error(f"Expected a dictionary but got: {type(message_dict)}")
-
-    except json.JSONDecodeError:
+        message_dict = parse_json(message)
+    except (ValueError, TypeError):  # bad JSON, or a null value such as a tombstone
         logger.error(f"Invalid JSON message: {message}")
+        return None
+
+    if not isinstance(message_dict, JSON_OBJECT_TYPES):
+        logger.error(f"Expected a dictionary but got: {type(message_dict)}")
+        return None
+
+    try:
+        # Intern the few distinct authors and categories, so every message shares
+        # one str object per value and counter lookups match by identity.
+        # Missing or non-string values (null, numbers, objects) fall back to the defaults
+        author = message_dict.get("author")
+        author = sys.intern(author) if isinstance(author, str) else "unknown"
+        category = message_dict.get("category")
+        category = sys.intern(category) if isinstance(category, str) else "uncategorized"
+        sentiment = float(message_dict.get("sentiment", 0.0))
+        message_length = int(message_dict.get("message_length", 0))
+        if not 0 <= message_length <= MESSAGE_LENGTH_LIMIT:  # must fit the int32 ring buffer
+            raise ValueError(f"message_length out of range: {message_length}")
+
+        # Messages without a valid timestamp still count, but are left off the trend
+        timestamp = float("nan")
+        timestamp_str = message_dict.get("timestamp", "")
+        if timestamp_str:  # Only proceed if a timestamp exists
+            try:
+                timestamp = parse_timestamp(timestamp_str)
+            except (ValueError, TypeError):  # a malformed or non-string timestamp
+                logger.error(f"Invalid timestamp format: {timestamp_str}")
     except Exception as e:
         logger.error(f"Error processing message: {e}")
+        return None
+
+    return author, category, timestamp, sentiment, message_length
+
+
+def write_ring(buffer: np.ndarray, start: int, values: np.ndarray) -> int:
+    """
+    Copy values into a ring buffer starting at index start, wrapping around.
+
+    At most two slice assignments are made, whatever the number of values.
+    Returns the next write position.
+    """
+    size = buffer.shape[0]
+    skipped = values.shape[0] - size
+    if skipped > 0:  # Only the newest values fit
+        values = values[skipped:]
+        start = (start + skipped) % size
+    first = min(values.shape[0], size - start)
+    buffer[start:start + first] = values[:first]
+    buffer[:values.shape[0] - first] = values[first:]
+    return (start + values.shape[0]) % size
+
+
+def apply_messages(parsed: list) -> None:
+    """
+    Update the dashboard data with a batch of parsed messages.
+
+    The arrays are built outside the lock. Counters (Counter.update, counted in C)
+    and ring buffers (vectorized slices) are then updated under a single lock
+    acquisition, so the plot thread never sees a half-written batch.
+    """
+    global _ml_idx, _ml_full, _sent_idx, _sent_count, _messages_processed
+
+    if not parsed:
+        return
+    count = len(parsed)
+    authors, categories, timestamps, sentiments, lengths = zip(*parsed)
+
+    # Build the columns, skipping sentiment for messages without a valid timestamp
+    # np.fromiter with a known count fills each column without an intermediate list
+    times = np.fromiter(timestamps, dtype=np.float64, count=count)
+    has_time = ~np.isnan(times)
+    dates = times[has_time] / SECONDS_PER_DAY  # Matplotlib date numbers
+    scores = np.fromiter(sentiments, dtype=np.float64, count=count)[has_time]
+    length_values = np.fromiter(lengths, dtype=np.int32, count=count)
+
+    with metrics_lock:
+        # Update author and category counts
+        live_author_counts.update(authors)
+        live_category_counts.update(categories)
+
+        # Update sentiment trend
+        write_ring(sentiment_times, _sent_idx, dates)
+        _sent_idx = write_ring(sentiment_scores, _sent_idx, scores)
+        _sent_count = min(_sent_count + scores.shape[0], SENTIMENT_WINDOW)
+
+        # Update message lengths; mark the buffer full only after it is written
+        wraps = _ml_idx + count >= MESSAGE_LENGTH_BUFFER_SIZE
+        _ml_idx = write_ring(message_lengths, _ml_idx, length_values)
+        _ml_full = _ml_full or wraps
+
+    # Log a short summary every METRICS_LOG_INTERVAL messages, never whole counters
+    previous = _messages_processed
+    _messages_processed += count
+    if _messages_processed // METRICS_LOG_INTERVAL > previous // METRICS_LOG_INTERVAL:
+        top_author = live_author_counts.most_common(1)
+        logger.info(
+            f"Processed {_messages_processed} messages. Since last frame: "
+            f"{len(live_author_counts)} authors, {len(live_category_counts)} categories, "
+            f"top author {top_author[0] if top_author else None}"
+        )
+
+
+def parse_messages(messages) -> list:
+    """Parse a sequence of raw JSON messages, dropping the ones that cannot be used."""
+    return [fields for fields in map(parse_message, messages) if fields is not None]
+
+
+def process_messages(messages, executor=None) -> None:
+    """
+    Parse a batch of raw JSON messages and update the dashboard data once.
+
+    With an executor, batches larger than PARSE_SLICE_SIZE are parsed in slices
+    on the worker threads. The state update always runs on the calling thread.
+    """
+    if executor is None or len(messages) <= PARSE_SLICE_SIZE:
+        parsed = parse_messages(messages)
+    else:
+        slices = [messages[i:i + PARSE_SLICE_SIZE] for i in range(0, len(messages), PARSE_SLICE_SIZE)]
+        parsed = [fields for chunk in executor.map(parse_messages, slices) for fields in chunk]
+    apply_messages(parsed)
 
 
 #####################################
 # Set up live visuals
 #####################################
 
-def consume_messages(consumer, topic):
+def log_commit_result(offsets, response) -> None:
+    """Log asynchronous offset commits that failed."""
+    if isinstance(response, Exception):
+        logger.warning(f"Offset commit failed: {response}")
+
+
+def consume_messages(consumer, topic, stop_event, parser_workers=1):
+    """
+    Poll Kafka in batches and process every record in each batch, until stop_event is set.
+
+    With parser_workers > 1, large batches are parsed on a thread pool
+    (only useful on free-threaded Python builds); otherwise they are parsed inline.
+    Offsets are committed asynchronously once per batch rather than per message,
+    so the consumer never waits on a commit round trip before the next poll.
+    """
+    executor = None
+    last_batch_applied = True  # False while a polled batch has not been fully applied
     try:
-        for message in consumer:
-            message_str = message.value
-            logger.debug(f"Received message at offset {message.offset}: {message_str}")
-            process_message(message_str)
+        if parser_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=parser_workers, thread_name_prefix="json-parser")
+        while not stop_event.is_set():
+            batches = consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=POLL_MAX_RECORDS)
+            if not batches:
+                continue
+            last_batch_applied = False
+            values = [record.value for records in batches.values() for record in records]
+            process_messages(values, executor)
+            last_batch_applied = True
+            consumer.commit_async(callback=log_commit_result)
+            lazy_logger.debug(
+                "Polled {} messages ({} bytes) in one batch",
+                lambda: len(values),
+                lambda: sum(map(len, values)),
+            )
     except KeyboardInterrupt:
         logger.warning("Consumer interrupted by user.")
     except Exception as e:
         logger.error(f"Error while consuming messages: {e}")
     finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        # Commit the last processed batch before closing, but never the
+        # positions of a batch that was cut short and not applied
+        if last_batch_applied:
+            try:
+                consumer.commit()
+            except Exception as e:
+                logger.error(f"Error committing final offsets: {e}")
+        else:
+            logger.warning("Last batch was not fully processed; skipping final offset commit.")
         consumer.close()
         logger.info(f"Kafka consumer for topic '{topic}' closed.")
 
@@ -230,35 +705,52 @@ def consume_messages(consumer, topic):
 #####################################
 
 def main() -> None:
+    global dashboard_animation
+
     logger.info("START consumer.")
 
     # fetch .env content
     topic = get_kafka_topic()
     group_id = get_kafka_consumer_group_id()
+    parser_workers = get_parser_workers()
     logger.info(f"Consumer: Topic '{topic}' and group '{group_id}'...")
 
     # Create the Kafka consumer using the helpful utility function.
-    consumer = create_kafka_consumer(topic, group_id)
+    # Keep message values as raw bytes; the JSON parser reads them without a str decode.
+    # Auto-commit is off; offsets are committed asynchronously once per polled batch.
+    consumer = create_kafka_consumer(
+        topic,
+        group_id,
+        value_deserializer_provided=lambda x: x,
+        fetch_min_bytes=FETCH_MIN_BYTES,
+        fetch_max_wait_ms=FETCH_MAX_WAIT_MS,
+        max_partition_fetch_bytes=MAX_PARTITION_FETCH_BYTES,
+        enable_auto_commit=False,
+    )
 
     # Start the consumer thread as a daemon thread
-    consumer_thread = threading.Thread(target=consume_messages, args=(consumer, topic))
+    stop_event = threading.Event()
+    consumer_thread = threading.Thread(
+        target=consume_messages, args=(consumer, topic, stop_event, parser_workers)
+    )
     consumer_thread.daemon = True  # Important: Allow the main thread to exit
     consumer_thread.start()
 
     # Create the FuncAnimation object to update the dashboard every 5000 ms (5 seconds)
-    dashboard_animation = FuncAnimation(fig, update_dashboard, interval=5000)
+    # blit=True redraws only the returned artists on top of a cached background
+    # cache_frame_data=False keeps the animation from storing every frame's data
+    dashboard_animation = FuncAnimation(
+        fig, update_dashboard, interval=5000, blit=True, cache_frame_data=False
+    )
 
-    # Use a non-blocking pause
+    # Block in the GUI event loop until the window is closed
     try:
-        while True:
-            plt.pause(0.1)  # Pause briefly to allow events to be processed
+        plt.show()
     except KeyboardInterrupt:
         pass  # Handle Ctrl+C gracefully
-    
-    plt.ioff()  # Turn off interactive mode
-    plt.show()  # Keep the final chart displayed
 
-    # Ensure the consumer thread is properly joined
+    # Stop the consumer and ensure the thread is properly joined
+    stop_event.set()
     consumer_thread.join()
 
 #####################################
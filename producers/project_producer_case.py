@@ -30,6 +30,7 @@ from dotenv import load_dotenv
 # Import Kafka only if available
 try:
     from kafka import KafkaProducer
+    from kafka.codec import has_lz4
     KAFKA_AVAILABLE = True
 except ImportError:
     KAFKA_AVAILABLE = False
@@ -144,9 +145,14 @@ def main():
     producer = None
     if KAFKA_AVAILABLE:
         try:
+            # Batch messages for up to 100 ms and compress each batch with LZ4
+            # (if the lz4 package is installed) to cut bytes on the wire
             producer = KafkaProducer(
                 bootstrap_servers=kafka_server,
-                value_serializer=lambda x: json.dumps(x).encode("utf-8")
+                value_serializer=lambda x: json.dumps(x).encode("utf-8"),
+                linger_ms=100,
+                batch_size=64000,
+                compression_type="lz4" if has_lz4() else None,
             )
             logger.info(f"Kafka producer connected to {kafka_server}")
         except Exception as e:
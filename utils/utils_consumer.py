@@ -26,6 +26,10 @@ def create_kafka_consumer(
     topic_provided: str = None,
     group_id_provided: str = None,
     value_deserializer_provided=None,
+    fetch_min_bytes: int = 1,
+    fetch_max_wait_ms: int = 500,
+    max_partition_fetch_bytes: int = 1024 * 1024,
+    enable_auto_commit: bool = True,
 ):
     """
     Create and return a Kafka consumer instance.
@@ -34,6 +38,10 @@ def create_kafka_consumer(
         topic_provided (str): The Kafka topic to subscribe to. Defaults to the environment variable or default.
         group_id_provided (str): The consumer group ID. Defaults to the environment variable or default.
         value_deserializer_provided (callable, optional): Function to deserialize message values.
+        fetch_min_bytes (int): Minimum bytes the broker should gather before answering a fetch.
+        fetch_max_wait_ms (int): Maximum time the broker waits to reach fetch_min_bytes.
+        max_partition_fetch_bytes (int): Maximum bytes returned per partition in one fetch.
+        enable_auto_commit (bool): Commit offsets automatically. Set False to commit per batch.
 
     Returns:
         KafkaConsumer: Configured Kafka consumer instance.
@@ -54,7 +62,10 @@ def create_kafka_consumer(
             or (lambda x: x.decode("utf-8")),
             bootstrap_servers=kafka_broker,
             auto_offset_reset="earliest",
-            enable_auto_commit=True,
+            enable_auto_commit=enable_auto_commit,
+            fetch_min_bytes=fetch_min_bytes,
+            fetch_max_wait_ms=fetch_max_wait_ms,
+            max_partition_fetch_bytes=max_partition_fetch_bytes,
         )
         logger.info("Kafka consumer created successfully.")
         return consumer